@@ -0,0 +1,143 @@
+import math
+import random
+import numpy as np
+from equations import calculate_derivative_multi_by_time, calculate_displacement
+from display_factory import HeadlessDisplay
+from game_manager import GameManager, GameOver
+from ground import Ground
+from pipes import Pipes
+from player import Player
+
+
+class BatchGame:
+    SURFACE_WIDTH = HeadlessDisplay.SURFACE_WIDTH
+    SURFACE_HEIGHT = HeadlessDisplay.SURFACE_HEIGHT
+    GROUND_HEIGHT = GameManager.GROUND_HEIGHT
+    PIPE_START_FACTORS = GameOver.PIPE_START_FACTORS
+    GROUND_START_FACTORS = [0, 1]
+
+    def __init__(self, seeds, course=None):
+        self.size = len(seeds)
+        self.course = course
+        if course is None:
+            self.rngs = [random.Random(seed) for seed in seeds]
+        else:
+            self.course_index = np.array(seeds, dtype=np.int64)
+
+        self._calculate_geometry()
+
+        self.player_y = np.zeros(self.size)
+        self.player_v = np.zeros(self.size)
+
+        self.ground_x = np.empty((self.size, len(self.GROUND_START_FACTORS)))
+        for index, factor in enumerate(self.GROUND_START_FACTORS):
+            self.ground_x[:, index] = self.ground_width * factor
+
+        self.pipe_x = np.empty((self.size, len(self.PIPE_START_FACTORS), 2))
+        self.pipe_y = np.empty((self.size, len(self.PIPE_START_FACTORS), 2))
+        self.previous_pipe_x = np.empty((self.size, len(self.PIPE_START_FACTORS)))
+
+        self.score = np.zeros(self.size, dtype=np.int64)
+        self.alive = np.ones(self.size, dtype=bool)
+
+        self.reset()
+
+    def _calculate_geometry(self):
+        self.player_x = round((self.SURFACE_WIDTH / 2) - (Player.WIDTH / 2))
+
+        self.ground_width = self.SURFACE_WIDTH * 1.05
+        self.ground_hit_box_width = round(self.ground_width)
+        self.ground_y = round(self.SURFACE_HEIGHT - self.GROUND_HEIGHT)
+
+        self.min_pipe_displacement, self.available_range_for_centre = Pipes.calculate_pipe_limitations(
+            self.SURFACE_HEIGHT - self.GROUND_HEIGHT)
+        self.pipe_respawn_x = self.SURFACE_WIDTH * Pipes.RESPAWN_FACTOR_OUTSIDE_WINDOW - Pipes.WIDTH
+        self.surface_mid_point = self.SURFACE_WIDTH / 2
+
+    def reset(self, mask=None):
+        indices = np.arange(self.size) if mask is None else np.flatnonzero(mask)
+
+        for pipe_index, factor in enumerate(self.PIPE_START_FACTORS):
+            self._respawn_pipes(pipe_index, indices, self.SURFACE_WIDTH * factor)
+            self.previous_pipe_x[indices, pipe_index] = np.floor(self.pipe_x[indices, pipe_index, 0])
+
+        self.player_y[indices] = 0
+        self.player_v[indices] = 0
+        self.score[indices] = 0
+        self.alive[indices] = True
+
+    def _respawn_pipes(self, pipe_index, indices, x):
+        pipe_centres = self._get_pipe_centres(indices)
+        self.pipe_y[indices, pipe_index, 0] = np.round(-Pipes.HEIGHT + (pipe_centres - (Pipes.GAP_BETWEEN_PIPES / 2)))
+        self.pipe_y[indices, pipe_index, 1] = np.round(pipe_centres + (Pipes.GAP_BETWEEN_PIPES / 2))
+        self.pipe_x[indices, pipe_index, :] = x
+
+    def _get_pipe_centres(self, indices):
+        if self.course is None:
+            return np.array([self._get_random_pipe_centre(self.rngs[index]) for index in indices])
+
+        pipe_centres = self.course.centres[self.course_index[indices] % len(self.course)]
+        self.course_index[indices] += 1
+        return pipe_centres
+
+    def _get_random_pipe_centre(self, rng):
+        return self.min_pipe_displacement + (Pipes.GAP_BETWEEN_PIPES / 2) + \
+            math.floor(self.available_range_for_centre * rng.random())
+
+    def _collides_with_player(self, x, y, width, height):
+        player_y = np.floor(self.player_y)
+        x = np.floor(x)
+        return (self.player_x < x + width) & (player_y < y + height) & \
+            (self.player_x + Player.WIDTH > x) & (player_y + Player.HEIGHT > y)
+
+    def step(self, time_ms, jumps=None):
+        time_sec = time_ms / 1000
+        active = self.alive.copy()
+
+        if jumps is not None:
+            self.player_v[active & jumps] = Player.JUMP_VELOCITY
+
+        np.add(self.player_y, calculate_displacement(self.player_v, Player.ACCELERATION, time_sec),
+               out=self.player_y, where=active)
+        np.add(self.player_v, calculate_derivative_multi_by_time(Player.ACCELERATION, time_sec),
+               out=self.player_v, where=active)
+
+        collided = np.zeros(self.size, dtype=bool)
+        self._move_grounds_and_check_for_player_collision(time_sec, active, collided)
+        self._move_pipes_and_check_for_player_collision(time_sec, active, collided)
+
+        self.alive &= ~collided
+        return collided
+
+    def _move_grounds_and_check_for_player_collision(self, time_sec, active, collided):
+        ground_delta = calculate_derivative_multi_by_time(Ground.U, time_sec)
+        for index in range(self.ground_x.shape[1]):
+            moving = active & ~collided
+            ground_x = self.ground_x[:, index]
+            np.subtract(ground_x, ground_delta, out=ground_x, where=moving)
+            ground_x[moving & (ground_x <= -self.ground_width)] = self.ground_width
+
+            collided |= moving & self._collides_with_player(
+                ground_x, self.ground_y, self.ground_hit_box_width, self.GROUND_HEIGHT)
+
+    def _move_pipes_and_check_for_player_collision(self, time_sec, active, collided):
+        pipe_delta = calculate_derivative_multi_by_time(Pipes.U, time_sec)
+        for pipe_index in range(self.pipe_x.shape[1]):
+            moving = active & ~collided
+            pipe_x = self.pipe_x[:, pipe_index]
+            pipe_y = self.pipe_y[:, pipe_index]
+            np.copyto(self.previous_pipe_x[:, pipe_index], np.floor(pipe_x[:, 0]), where=moving)
+
+            for hit_box_index in range(2):
+                np.subtract(pipe_x[:, hit_box_index], pipe_delta, out=pipe_x[:, hit_box_index], where=moving)
+                respawning = moving & (pipe_x[:, hit_box_index] <= -Pipes.WIDTH)
+                if respawning.any():
+                    self._respawn_pipes(pipe_index, np.flatnonzero(respawning), self.pipe_respawn_x)
+
+            hit = moving & (self._collides_with_player(pipe_x[:, 0], pipe_y[:, 0], Pipes.WIDTH, Pipes.HEIGHT) |
+                            self._collides_with_player(pipe_x[:, 1], pipe_y[:, 1], Pipes.WIDTH, Pipes.HEIGHT))
+            collided |= hit
+
+            passed = (self.previous_pipe_x[:, pipe_index] + Pipes.WIDTH > self.surface_mid_point) & \
+                (self.surface_mid_point >= np.floor(pipe_x[:, 0]) + Pipes.WIDTH)
+            self.score += moving & ~hit & passed
@@ -0,0 +1,50 @@
+import time
+import numpy as np
+import pygame
+from batch_game import BatchGame
+from game_manager import GameManager
+
+FRAME_TIME_MS = 33
+STEPS = 200
+BATCH_SIZES = [1, 100, 10000, 100000]
+
+RESTART_EVENT = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r)
+
+
+def gap_following_jumps(batch_game):
+    reachable = batch_game.pipe_x[:, :, 0] + 52 >= batch_game.player_x
+    next_pipe = np.where(reachable, batch_game.pipe_x[:, :, 0], np.inf).argmin(axis=1)
+    gap_bottom = batch_game.pipe_y[np.arange(batch_game.size), next_pipe, 1]
+    return (batch_game.player_y + 20 > gap_bottom - 15) & (batch_game.player_v >= 0)
+
+
+def run_batch(size):
+    batch_game = BatchGame(range(size))
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        batch_game.step(FRAME_TIME_MS, gap_following_jumps(batch_game))
+        if not batch_game.alive.all():
+            batch_game.reset(~batch_game.alive)
+    return size * STEPS / (time.perf_counter() - start)
+
+
+def run_game_running():
+    game_manager = GameManager('', headless=True)
+    game_running = game_manager.game_states[1]
+    start = time.perf_counter()
+    for _ in range(STEPS * 10):
+        if game_running.increment_game_through_time(FRAME_TIME_MS, game_manager.grounds):
+            game_manager.game_states[2].handle_events([RESTART_EVENT])
+        elif game_manager.player.hit_box.bottom > 300:
+            game_manager.player.jump()
+    return STEPS * 10 / (time.perf_counter() - start)
+
+
+def main():
+    print(f'GameRunning (headless): {run_game_running():14.0f} bird-steps/s')
+    for size in BATCH_SIZES:
+        print(f'BatchGame N={size:<10} {run_batch(size):14.0f} bird-steps/s')
+
+
+if __name__ == '__main__':
+    main()
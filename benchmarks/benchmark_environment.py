@@ -0,0 +1,28 @@
+import time
+from environment import FlappyBirdEnvironment
+
+STEPS = 50000
+FRAME_SKIPS = [1, 4]
+
+
+def run(frame_skip):
+    environment = FlappyBirdEnvironment(frame_skip=frame_skip)
+    observation = environment.reset(0)
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        action = observation[0] + 20 > observation[4] - 15 and observation[1] >= 0
+        observation, reward, done, info = environment.step(action)
+        if done:
+            observation = environment.reset(info['frames'])
+    return STEPS / (time.perf_counter() - start)
+
+
+def main():
+    for frame_skip in FRAME_SKIPS:
+        steps_per_second = run(frame_skip)
+        print(f'frame_skip={frame_skip}: {steps_per_second:10.0f} env steps/s '
+              f'{steps_per_second * frame_skip:10.0f} physics ticks/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+import os
+import time
+from episode_runner import EpisodeRunner
+from policies import follow_gap_policy
+
+EPISODES = 64
+MAX_FRAMES = 3000
+
+
+def main():
+    worker_counts = sorted({1, 2, 4, os.cpu_count()})
+    baseline = None
+    for workers in worker_counts:
+        runner = EpisodeRunner(follow_gap_policy, workers=workers, max_frames=MAX_FRAMES)
+        start = time.perf_counter()
+        frames = sum(result.frames for result in runner.run(range(EPISODES)))
+        elapsed = time.perf_counter() - start
+
+        baseline = baseline or elapsed
+        print(f'workers={workers:<3} {EPISODES / elapsed:8.1f} episodes/s {frames / elapsed:12.0f} frames/s '
+              f'{baseline / elapsed:6.2f}x')
+
+
+if __name__ == '__main__':
+    main()
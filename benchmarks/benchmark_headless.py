@@ -0,0 +1,56 @@
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from game_manager import GameManager
+
+FRAME_TIME_MS = 33
+WINDOWED_STEPS = 1000
+HEADLESS_STEPS = 50000
+
+SPACE_EVENT = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+RESTART_EVENT = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r)
+
+
+def next_pipe(game_manager):
+    player = game_manager.player
+    return min((pipe for pipe in game_manager.pipes if pipe.hit_boxes[0].right >= player.hit_box.left),
+               key=lambda pipe: pipe.hit_boxes[0].x)
+
+
+def policy_events(game_manager):
+    if game_manager.active_state_index == 2:
+        return [RESTART_EVENT]
+    if game_manager.active_state_index == 0:
+        return [SPACE_EVENT]
+
+    gap_bottom = next_pipe(game_manager).hit_boxes[1].top
+    if game_manager.player.hit_box.bottom > gap_bottom - 10 and game_manager.player.v >= 0:
+        return [SPACE_EVENT]
+    return []
+
+
+def run(game_manager, steps):
+    start = time.perf_counter()
+    for _ in range(steps):
+        game_manager.manage_events(policy_events(game_manager))
+        game_manager.increment_game_through_time(FRAME_TIME_MS)
+    return steps / (time.perf_counter() - start)
+
+
+def main():
+    pygame.init()
+    cwd = os.getcwd()
+
+    windowed = run(GameManager(cwd), WINDOWED_STEPS)
+    headless = run(GameManager(cwd, headless=True), HEADLESS_STEPS)
+
+    print(f'windowed: {windowed:12.0f} steps/s')
+    print(f'headless: {headless:12.0f} steps/s')
+    print(f'speed-up: {headless / windowed:12.1f}x')
+
+
+if __name__ == '__main__':
+    main()
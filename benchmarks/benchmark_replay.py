@@ -0,0 +1,40 @@
+import time
+import pygame
+from game_manager import GameManager
+from policies import follow_gap_policy
+from replay import ReplayRecorder, ReplayPlayer
+
+TICK_MS = 1000 / 30
+RUN_FRAMES = 30 * 60 * 10
+SEED = 1
+
+SPACE_EVENT = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+
+
+def record_run():
+    game_manager = GameManager('', headless=True, seed=SEED)
+    game_manager.active_state_index = 1
+    recorder = ReplayRecorder(SEED)
+    game_manager.game_states[1].recorder = recorder
+
+    for _ in range(RUN_FRAMES):
+        if follow_gap_policy(game_manager):
+            game_manager.manage_events([SPACE_EVENT])
+        game_manager.update(TICK_MS)
+    recorder.finish(game_manager.score_counter.get_score())
+    return recorder.replay
+
+
+def main():
+    replay = record_run()
+    start = time.perf_counter()
+    verified = ReplayPlayer().verify(replay)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f'{replay.frames} frames, {len(replay.jump_frames)} jumps, score {replay.score}, '
+          f'{len(replay.to_bytes())} bytes')
+    print(f'verified={verified} in {elapsed_ms:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import math
+import random
+from multiprocessing import shared_memory
+import numpy as np
+from pipes import Pipes
+
+
+class PipeCourse:
+    LENGTH = 1024
+
+    def __init__(self, centres, shared_memory_block=None):
+        self.centres = centres
+        self.centres.flags.writeable = False
+        self._shared_memory_block = shared_memory_block
+
+    @classmethod
+    def generate(cls, seed, height_available_for_pipes, length=LENGTH):
+        min_pipe_displacement, available_range_for_centre = Pipes.calculate_pipe_limitations(
+            height_available_for_pipes)
+        rng = random.Random(seed)
+
+        centres = np.empty(length)
+        for index in range(length):
+            centres[index] = min_pipe_displacement + (Pipes.GAP_BETWEEN_PIPES / 2) + \
+                math.floor(available_range_for_centre * rng.random())
+        return cls(centres)
+
+    def __len__(self):
+        return len(self.centres)
+
+    def to_shared_memory(self):
+        block = shared_memory.SharedMemory(create=True, size=self.centres.nbytes)
+        np.ndarray(self.centres.shape, dtype=self.centres.dtype, buffer=block.buf)[:] = self.centres
+        return block
+
+    @classmethod
+    def from_shared_memory(cls, name, length):
+        block = shared_memory.SharedMemory(name=name)
+        return cls(np.ndarray((length,), dtype=np.float64, buffer=block.buf), block)
+
+    def cursor(self, index=0):
+        return CourseCursor(self, index)
+
+
+class CourseCursor:
+    def __init__(self, course, index=0):
+        self.course = course
+        self.index = index
+
+    def next_centre(self):
+        centre = self.course.centres[self.index % len(self.course)]
+        self.index += 1
+        return float(centre)
@@ -0,0 +1,73 @@
+import numpy as np
+from episode_runner import EpisodeRunner
+from game_manager import GameManager
+
+
+class FlappyBirdEnvironment:
+    FRAME_TIME_MS = 1000 / 30
+    OBSERVED_PIPES = 2
+    OBSERVATION_SIZE = 2 + 3 * OBSERVED_PIPES
+
+    PASS_REWARD = 1.0
+    ALIVE_REWARD = 0.01
+    DEATH_REWARD = -1.0
+
+    def __init__(self, frame_skip=1, time_ms=FRAME_TIME_MS, max_frames=None):
+        self.frame_skip = frame_skip
+        self.time_ms = time_ms
+        self.max_frames = max_frames
+
+        self.game_manager = None
+        self.game_running = None
+        self.frames = 0
+
+    def reset(self, seed=None):
+        self.game_manager = GameManager('', headless=True, seed=seed)
+        self.game_manager.active_state_index = 1
+        self.game_running = self.game_manager.game_states[1]
+        self.frames = 0
+        return self._get_observation()
+
+    def step(self, action):
+        if action:
+            self.game_manager.player.jump()
+
+        reward = 0.0
+        cause_of_death = None
+        for _ in range(self.frame_skip):
+            score = self.game_manager.score_counter.get_score()
+            game_over = self.game_running.update(self.time_ms, self.game_manager.grounds)
+            self.frames += 1
+
+            if game_over:
+                reward += self.DEATH_REWARD
+                cause_of_death = self.game_running.cause_of_death
+                break
+
+            reward += self.ALIVE_REWARD + self.PASS_REWARD * (self.game_manager.score_counter.get_score() - score)
+            if self.max_frames is not None and self.frames >= self.max_frames:
+                cause_of_death = EpisodeRunner.TIMEOUT
+                break
+
+        done = cause_of_death is not None
+        return self._get_observation(), reward, done, self._get_info(cause_of_death)
+
+    def _get_observation(self):
+        player = self.game_manager.player
+        observation = np.empty(self.OBSERVATION_SIZE, dtype=np.float32)
+        observation[0] = player.y
+        observation[1] = player.v
+
+        upcoming_pipes = sorted((pipe for pipe in self.game_manager.pipes
+                                 if pipe.hit_boxes[0].right >= player.hit_box.left),
+                                key=lambda pipe: pipe.hit_boxes[0].x)
+        for index, pipe in enumerate(upcoming_pipes[:self.OBSERVED_PIPES]):
+            offset = 2 + 3 * index
+            observation[offset] = pipe.positions[0] - player.hit_box.x
+            observation[offset + 1] = pipe.hit_boxes[0].bottom
+            observation[offset + 2] = pipe.hit_boxes[1].top
+        return observation
+
+    def _get_info(self, cause_of_death):
+        return {'score': self.game_manager.score_counter.get_score(), 'frames': self.frames,
+                'cause_of_death': cause_of_death}
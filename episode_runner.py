@@ -0,0 +1,64 @@
+import os
+from collections import namedtuple
+from functools import partial
+from multiprocessing import Pool
+from course import PipeCourse
+from game_manager import GameManager
+
+EpisodeResult = namedtuple('EpisodeResult', ['seed', 'score', 'frames', 'cause_of_death'])
+
+_worker_course = None
+
+
+def _attach_shared_course(name, length):
+    global _worker_course
+    _worker_course = PipeCourse.from_shared_memory(name, length)
+
+
+def run_episode(seed, policy, max_frames, time_ms, course=None):
+    course = course if course is not None else _worker_course
+    if course is None:
+        game_manager = GameManager('', headless=True, seed=seed)
+    else:
+        game_manager = GameManager('', headless=True, course=course, course_index=seed)
+    game_manager.active_state_index = 1
+    game_running = game_manager.game_states[1]
+
+    for frame in range(max_frames):
+        if policy(game_manager):
+            game_manager.player.jump()
+        if game_running.update(time_ms, game_manager.grounds):
+            return EpisodeResult(seed, game_manager.score_counter.get_score(), frame + 1,
+                                 game_running.cause_of_death)
+
+    return EpisodeResult(seed, game_manager.score_counter.get_score(), max_frames, EpisodeRunner.TIMEOUT)
+
+
+class EpisodeRunner:
+    FRAME_TIME_MS = 1000 / 30
+    MAX_FRAMES = 30 * 60 * 10
+    TIMEOUT = 'timeout'
+    CHUNK_SIZE = 16
+
+    def __init__(self, policy, workers=None, max_frames=MAX_FRAMES, time_ms=FRAME_TIME_MS, course=None):
+        self.workers = workers or os.cpu_count()
+        self.course = course
+        self._run_episode = partial(run_episode, policy=policy, max_frames=max_frames, time_ms=time_ms)
+
+    def run(self, seeds):
+        if self.workers == 1:
+            yield from map(partial(self._run_episode, course=self.course), seeds)
+            return
+
+        if self.course is None:
+            with Pool(self.workers) as pool:
+                yield from pool.imap_unordered(self._run_episode, seeds, self.CHUNK_SIZE)
+            return
+
+        block = self.course.to_shared_memory()
+        try:
+            with Pool(self.workers, initializer=_attach_shared_course, initargs=(block.name, len(self.course))) as pool:
+                yield from pool.imap_unordered(self._run_episode, seeds, self.CHUNK_SIZE)
+        finally:
+            block.close()
+            block.unlink()
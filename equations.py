@@ -1,5 +1,10 @@
-import math
-
-
-def calculate_derivative_multi_by_time(derivative, time_sec):
-    return math.floor(derivative * time_sec)
+def calculate_derivative_multi_by_time(derivative, time_sec):
+    return derivative * time_sec
+
+
+def calculate_displacement(velocity, acceleration, time_sec):
+    return velocity * time_sec + (acceleration * time_sec * time_sec) / 2
+
+
+def interpolate(previous, current, alpha):
+    return previous + ((current - previous) * alpha)
@@ -0,0 +1,16 @@
+class FixedTimestep:
+    MAX_FRAME_TIME_MS = 250
+
+    def __init__(self, tick_rate):
+        self.tick_ms = 1000 / tick_rate
+        self.accumulator = 0
+
+    def advance(self, frame_time_ms):
+        self.accumulator += min(frame_time_ms, self.MAX_FRAME_TIME_MS)
+        ticks = int(self.accumulator // self.tick_ms)
+        self.accumulator -= ticks * self.tick_ms
+        return ticks
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.tick_ms
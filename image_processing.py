@@ -1,7 +1,12 @@
-import pygame
-
-
-class ImageProcessing:
-    @staticmethod
-    def load_and_scale_image(file_path, width, height):
-        return pygame.transform.scale(pygame.image.load(file_path), (width, height))
+import os
+import pygame
+
+
+class ImageProcessing:
+    @staticmethod
+    def resolve_path(file_path):
+        return file_path.replace('\\', os.sep)
+
+    @classmethod
+    def load_and_scale_image(cls, file_path, width, height):
+        return pygame.transform.scale(pygame.image.load(cls.resolve_path(file_path)), (width, height))
@@ -1,20 +1,36 @@
-import os
-import pygame
-from game_manager import GameManager
-
-FPS = 30
-
-pygame.init()
-
-game_manager = GameManager(os.getcwd())
-
-clock = pygame.time.Clock()
-
-running = True
-while running:
-    clock.tick(FPS)
-
-    running = game_manager.manage_events(pygame.event.get())
-    game_manager.increment_game_through_time(clock.get_time())
-
-    pygame.display.update()
+import os
+import pygame
+from game_loop import FixedTimestep
+from game_manager import GameManager
+from replay import ReplayRecorder
+
+FPS = 60
+TICK_RATE = 30
+SEED = 1
+REPLAY_FILE_PATH = os.environ.get('FLAPPY_REPLAY')
+
+pygame.init()
+
+game_manager = GameManager(os.getcwd(), seed=SEED)
+
+recorder = None
+if REPLAY_FILE_PATH:
+    recorder = ReplayRecorder(SEED)
+    game_manager.game_states[1].recorder = recorder
+
+clock = pygame.time.Clock()
+timestep = FixedTimestep(TICK_RATE)
+
+running = True
+while running:
+    clock.tick(FPS)
+
+    running = game_manager.manage_events(pygame.event.get())
+    for _ in range(timestep.advance(clock.get_time())):
+        game_manager.update(timestep.tick_ms)
+    game_manager.draw(timestep.alpha)
+
+    pygame.display.update()
+
+if recorder is not None and recorder.finished:
+    recorder.replay.save(REPLAY_FILE_PATH)
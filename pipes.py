@@ -1,78 +1,103 @@
-import pygame
-import math
-import random
-from equations import calculate_derivative_multi_by_time
-from image_processing import ImageProcessing
-
-random.seed(1)
-
-
-class Pipes:
-    FILE_PATH_UPPER_PIPE = "\\Images\\pipe_top.png"
-    FILE_PATH_LOWER_PIPE = "\\Images\\pipe_bottom.png"
-    image_processor = ImageProcessing()
-
-    WIDTH = 52
-    HEIGHT = 800
-    U = 70
-
-    GAP_BETWEEN_PIPES = 100
-
-    def __init__(self, cwd, height_available_for_pipes, surface_width, factor_outside_window):
-        self.surface_width = surface_width
-        self.height_available_for_pipes = height_available_for_pipes
-
-        self._calculate_pipe_limitations()
-        self._load_pipe_images(cwd)
-        self._create_pipe_hit_boxes()
-        self.reset(factor_outside_window, 0)
-
-        self.previous_x = self.hit_boxes[0].x
-
-    def _load_pipe_images(self, cwd):
-        self.pipes = list()
-        self.pipes.append(self.image_processor.load_and_scale_image(cwd + self.FILE_PATH_UPPER_PIPE,
-                                                                    self.WIDTH, self.HEIGHT))
-        self.pipes.append(self.image_processor.load_and_scale_image(cwd + self.FILE_PATH_LOWER_PIPE,
-                                                                    self.WIDTH, self.HEIGHT))
-
-    def _calculate_pipe_limitations(self):
-        self.min_pipe_displacement = math.floor(0.2 * self.height_available_for_pipes)
-        self.available_range_for_centre = self.height_available_for_pipes - self.GAP_BETWEEN_PIPES - (
-                2 * self.min_pipe_displacement)
-
-    def _create_pipe_hit_boxes(self):
-        self.hit_boxes = list()
-        for pipe in self.pipes:
-            self.hit_boxes.append(pipe.get_rect())
-
-    def move(self, time_ms):
-        self.previous_x = self.hit_boxes[0].x
-        for hit_box in self.hit_boxes:
-            hit_box.x -= calculate_derivative_multi_by_time(self.U, (time_ms / 1000))
-            if hit_box.x <= -self.WIDTH:
-                self.reset()
-
-    def draw(self, surface):
-        for index, pipe in enumerate(self.pipes):
-            surface.blit(pipe, self.hit_boxes[index])
-
-    def passed_over_player(self):
-        surface_mid_point = (self.surface_width / 2)
-        if self.previous_x + self.WIDTH > surface_mid_point >= self.hit_boxes[0].x + self.WIDTH:
-            return True
-        else:
-            return False
-
-    def reset(self, factor_outside_window=1.5, add_width=1):
-        pipe_centre = self._get_random_pipe_centre()
-
-        self.hit_boxes[0].y = -self.HEIGHT + (pipe_centre - (self.GAP_BETWEEN_PIPES / 2))
-        self.hit_boxes[1].y = pipe_centre + (self.GAP_BETWEEN_PIPES / 2)
-
-        self.hit_boxes[0].x = (self.surface_width * factor_outside_window) - (self.WIDTH * add_width)
-        self.hit_boxes[1].x = (self.surface_width * factor_outside_window) - (self.WIDTH * add_width)
-
-    def _get_random_pipe_centre(self):
-        return self.min_pipe_displacement + (self.GAP_BETWEEN_PIPES / 2) + \
-            math.floor(self.available_range_for_centre * random.random())
+import pygame
+import math
+import random
+from equations import calculate_derivative_multi_by_time, interpolate
+from image_processing import ImageProcessing
+
+
+class Pipes:
+    FILE_PATH_UPPER_PIPE = "\\images\\pipe_top.png"
+    FILE_PATH_LOWER_PIPE = "\\images\\pipe_bottom.png"
+    image_processor = ImageProcessing()
+
+    WIDTH = 52
+    HEIGHT = 800
+    U = 70
+
+    GAP_BETWEEN_PIPES = 100
+    RESPAWN_FACTOR_OUTSIDE_WINDOW = 1.5
+
+    def __init__(self, cwd, height_available_for_pipes, surface_width, factor_outside_window, headless=False,
+                 course=None):
+        self.surface_width = surface_width
+        self.height_available_for_pipes = height_available_for_pipes
+        self.course = course
+
+        self._calculate_pipe_limitations()
+        if headless:
+            self.pipes = list()
+            self.hit_boxes = [pygame.Rect(0, 0, self.WIDTH, self.HEIGHT), pygame.Rect(0, 0, self.WIDTH, self.HEIGHT)]
+        else:
+            self._load_pipe_images(cwd)
+            self._create_pipe_hit_boxes()
+        self.positions = [0, 0]
+        self.reset(factor_outside_window, 0)
+
+        self.previous_x = self.hit_boxes[0].x
+        self.previous_positions = list(self.positions)
+
+    def _load_pipe_images(self, cwd):
+        self.pipes = list()
+        self.pipes.append(self.image_processor.load_and_scale_image(cwd + self.FILE_PATH_UPPER_PIPE,
+                                                                    self.WIDTH, self.HEIGHT))
+        self.pipes.append(self.image_processor.load_and_scale_image(cwd + self.FILE_PATH_LOWER_PIPE,
+                                                                    self.WIDTH, self.HEIGHT))
+
+    def _calculate_pipe_limitations(self):
+        self.min_pipe_displacement, self.available_range_for_centre = self.calculate_pipe_limitations(
+            self.height_available_for_pipes)
+
+    @classmethod
+    def calculate_pipe_limitations(cls, height_available_for_pipes):
+        min_pipe_displacement = math.floor(0.2 * height_available_for_pipes)
+        available_range_for_centre = height_available_for_pipes - cls.GAP_BETWEEN_PIPES - (
+                2 * min_pipe_displacement)
+        return min_pipe_displacement, available_range_for_centre
+
+    def _create_pipe_hit_boxes(self):
+        self.hit_boxes = list()
+        for pipe in self.pipes:
+            self.hit_boxes.append(pipe.get_rect())
+
+    def move(self, time_ms):
+        self.previous_x = self.hit_boxes[0].x
+        for index, hit_box in enumerate(self.hit_boxes):
+            self.previous_positions[index] = self.positions[index]
+            self.positions[index] -= calculate_derivative_multi_by_time(self.U, (time_ms / 1000))
+            hit_box.x = math.floor(self.positions[index])
+            if self.positions[index] <= -self.WIDTH:
+                self.reset()
+
+    def draw(self, surface, alpha=1):
+        for index, pipe in enumerate(self.pipes):
+            surface.blit(pipe, self._get_draw_position(index, alpha))
+
+    def _get_draw_position(self, index, alpha):
+        if alpha == 1:
+            return self.hit_boxes[index]
+        return interpolate(self.previous_positions[index], self.positions[index], alpha), self.hit_boxes[index].y
+
+    def passed_over_player(self):
+        surface_mid_point = (self.surface_width / 2)
+        if self.previous_x + self.WIDTH > surface_mid_point >= self.hit_boxes[0].x + self.WIDTH:
+            return True
+        else:
+            return False
+
+    def reset(self, factor_outside_window=RESPAWN_FACTOR_OUTSIDE_WINDOW, add_width=1):
+        pipe_centre = self._get_random_pipe_centre()
+
+        self.hit_boxes[0].y = -self.HEIGHT + (pipe_centre - (self.GAP_BETWEEN_PIPES / 2))
+        self.hit_boxes[1].y = pipe_centre + (self.GAP_BETWEEN_PIPES / 2)
+
+        x = (self.surface_width * factor_outside_window) - (self.WIDTH * add_width)
+        self.positions = [x, x]
+        self.previous_positions = [x, x]
+        for hit_box in self.hit_boxes:
+            hit_box.x = math.floor(x)
+
+    def _get_random_pipe_centre(self):
+        if self.course is not None:
+            return self.course.next_centre()
+        return self.min_pipe_displacement + (self.GAP_BETWEEN_PIPES / 2) + \
+            math.floor(self.available_range_for_centre * random.random())
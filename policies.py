@@ -0,0 +1,13 @@
+def get_next_pipe(pipes, player):
+    upcoming_pipes = [pipe for pipe in pipes if pipe.hit_boxes[0].right >= player.hit_box.left]
+    return min(upcoming_pipes, key=lambda pipe: pipe.hit_boxes[0].x)
+
+
+def never_jump_policy(game_manager):
+    return False
+
+
+def follow_gap_policy(game_manager):
+    player = game_manager.player
+    gap_bottom = get_next_pipe(game_manager.pipes, player).hit_boxes[1].top
+    return player.hit_box.bottom > gap_bottom - 15 and player.v >= 0
@@ -0,0 +1,144 @@
+import struct
+import pygame
+from game_manager import GameManager
+
+
+def _encode_varint(value):
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7f) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return encoded
+
+
+def _decode_varints(data, count):
+    values = list()
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7f) << shift
+        shift += 7
+        if not byte & 0x80:
+            values.append(value)
+            value = shift = 0
+            if len(values) == count:
+                break
+    return values
+
+
+class Replay:
+    MAGIC = b'FBRP'
+    VERSION = 2
+    HEADER = struct.Struct('<4sBQIIIII')
+    TIME_STEP_RUN = struct.Struct('<Id')
+
+    def __init__(self, seed, jump_frames=None, time_step_runs=None, score=None, course_index=0):
+        self.seed = seed
+        self.course_index = course_index
+        self.jump_frames = jump_frames if jump_frames is not None else list()
+        self.time_step_runs = time_step_runs if time_step_runs is not None else list()
+        self.score = score
+
+    @property
+    def frames(self):
+        return sum(count for count, _ in self.time_step_runs)
+
+    def iter_time_steps(self):
+        for count, time_ms in self.time_step_runs:
+            for _ in range(count):
+                yield time_ms
+
+    def to_bytes(self):
+        data = bytearray(self.HEADER.pack(self.MAGIC, self.VERSION, self.seed, self.course_index, self.score,
+                                          self.frames, len(self.time_step_runs), len(self.jump_frames)))
+        for count, time_ms in self.time_step_runs:
+            data += self.TIME_STEP_RUN.pack(count, time_ms)
+
+        previous_frame = 0
+        for frame in self.jump_frames:
+            data += _encode_varint(frame - previous_frame)
+            previous_frame = frame
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed, course_index, score, frames, run_count, jump_count = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError('Not a Flappy Bird replay')
+
+        offset = cls.HEADER.size
+        time_step_runs = list()
+        for _ in range(run_count):
+            time_step_runs.append(cls.TIME_STEP_RUN.unpack_from(data, offset))
+            offset += cls.TIME_STEP_RUN.size
+
+        jump_frames = list()
+        frame = 0
+        for delta in _decode_varints(data[offset:], jump_count):
+            frame += delta
+            jump_frames.append(frame)
+
+        return cls(seed, jump_frames, time_step_runs, score, course_index)
+
+    def save(self, file_path):
+        with open(file_path, 'wb') as replay_file:
+            replay_file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, file_path):
+        with open(file_path, 'rb') as replay_file:
+            return cls.from_bytes(replay_file.read())
+
+
+class ReplayRecorder:
+    def __init__(self, seed, course_index=0):
+        self.replay = Replay(seed, course_index=course_index)
+        self.finished = False
+
+    def record_jump(self):
+        self.replay.jump_frames.append(self.replay.frames)
+
+    def record_tick(self, time_ms):
+        runs = self.replay.time_step_runs
+        if runs and runs[-1][1] == time_ms:
+            runs[-1] = (runs[-1][0] + 1, time_ms)
+        else:
+            runs.append((1, time_ms))
+
+    def finish(self, score):
+        self.replay.score = score
+        self.finished = True
+
+
+class ReplayPlayer:
+    def __init__(self, cwd='', headless=True, fps=None):
+        self.cwd = cwd
+        self.headless = headless
+        self.fps = fps
+
+    def play(self, replay):
+        game_manager = GameManager(self.cwd, headless=self.headless, seed=replay.seed,
+                                   course_index=replay.course_index)
+        game_manager.active_state_index = 1
+        clock = pygame.time.Clock()
+
+        jump_frames = iter(replay.jump_frames)
+        next_jump = next(jump_frames, None)
+        for frame, time_ms in enumerate(replay.iter_time_steps()):
+            while next_jump == frame:
+                game_manager.player.jump()
+                next_jump = next(jump_frames, None)
+
+            game_manager.update(time_ms)
+            if not self.headless:
+                game_manager.draw()
+                pygame.display.update()
+                if self.fps:
+                    clock.tick(self.fps)
+            if game_manager.active_state_index == 2:
+                break
+
+        return game_manager.score_counter.get_score()
+
+    def verify(self, replay):
+        return self.play(replay) == replay.score
@@ -0,0 +1,108 @@
+import random
+import unittest
+import numpy as np
+from batch_game import BatchGame
+from course import PipeCourse
+from game_manager import GameManager
+
+
+def get_policy_jumps(batch_game, rng):
+    reachable = batch_game.pipe_x[:, :, 0] + 52 >= batch_game.player_x
+    next_pipe = np.where(reachable, batch_game.pipe_x[:, :, 0], np.inf).argmin(axis=1)
+    gap_bottom = batch_game.pipe_y[np.arange(batch_game.size), next_pipe, 1]
+    below_gap = (batch_game.player_y + 20 > gap_bottom - 15) & (batch_game.player_v >= 0)
+    noise = np.array([rng.random() < 0.01 for _ in range(batch_game.size)])
+    return below_gap ^ noise
+
+
+def get_headless_game(seed):
+    game_manager = GameManager('file_path', headless=True, seed=seed)
+    return game_manager, game_manager.game_states[1]
+
+
+class TestBatchGame(unittest.TestCase):
+    SEEDS = [0, 1, 2, 3, 4, 5, 6, 7]
+
+    def assert_game_matches_batch(self, game_manager, batch_state, index):
+        player_y, player_v, score, ground_x, pipe_x, pipe_y = batch_state
+        self.assertEqual(game_manager.player.y, player_y[index])
+        self.assertEqual(game_manager.player.hit_box.y, np.floor(player_y[index]))
+        self.assertEqual(game_manager.player.v, player_v[index])
+        self.assertEqual(game_manager.score_counter.get_score(), score[index])
+        for ground_index, ground in enumerate(game_manager.grounds):
+            self.assertEqual(ground.x, ground_x[index, ground_index])
+            self.assertEqual(ground.hit_box.x, np.floor(ground_x[index, ground_index]))
+        for pipe_index, pipe in enumerate(game_manager.pipes):
+            for hit_box_index, hit_box in enumerate(pipe.hit_boxes):
+                self.assertEqual(pipe.positions[hit_box_index], pipe_x[index, pipe_index, hit_box_index])
+                self.assertEqual(hit_box.x, np.floor(pipe_x[index, pipe_index, hit_box_index]))
+                self.assertEqual(hit_box.y, pipe_y[index, pipe_index, hit_box_index])
+
+    @staticmethod
+    def get_batch_state(batch_game):
+        return batch_game.player_y.copy(), batch_game.player_v.copy(), batch_game.score.copy(), \
+            batch_game.ground_x.copy(), batch_game.pipe_x.copy(), batch_game.pipe_y.copy()
+
+    def test_init_places_games_at_start_positions(self):
+        batch_game = BatchGame(self.SEEDS)
+
+        for index, seed in enumerate(self.SEEDS):
+            game_manager, _ = get_headless_game(seed)
+            self.assert_game_matches_batch(game_manager, self.get_batch_state(batch_game), index)
+        self.assertTrue(batch_game.alive.all())
+
+    def test_step_matches_game_running_bit_for_bit(self):
+        self.assert_batch_matches_game_running(BatchGame(self.SEEDS), get_headless_game)
+
+    def test_step_on_shared_course_matches_game_running_bit_for_bit(self):
+        course = PipeCourse.generate(9, BatchGame.SURFACE_HEIGHT - BatchGame.GROUND_HEIGHT, length=40)
+
+        def get_game_on_course(course_index):
+            game_manager = GameManager('file_path', headless=True, course=course, course_index=course_index)
+            return game_manager, game_manager.game_states[1]
+
+        self.assert_batch_matches_game_running(BatchGame(self.SEEDS, course), get_game_on_course)
+
+    def assert_batch_matches_game_running(self, batch_game, get_game):
+        jump_rng = random.Random(42)
+        steps = list()
+
+        for _ in range(3000):
+            time_ms = jump_rng.choice([33, 33, 33, 16, 50])
+            jumps = get_policy_jumps(batch_game, jump_rng)
+            batch_game.step(time_ms, jumps)
+            steps.append((time_ms, jumps, batch_game.alive.copy(), self.get_batch_state(batch_game)))
+
+        for index, seed in enumerate(self.SEEDS):
+            game_manager, game_running = get_game(seed)
+            for time_ms, jumps, batch_alive, batch_state in steps:
+                if jumps[index]:
+                    game_manager.player.jump()
+                alive = not game_running.increment_game_through_time(time_ms, game_manager.grounds)
+
+                self.assertEqual(alive, batch_alive[index])
+                if not alive:
+                    self.assertEqual(game_manager.score_counter.get_score(), batch_game.score[index])
+                    break
+                self.assert_game_matches_batch(game_manager, batch_state, index)
+        self.assertGreater(batch_game.score.max(), 3)
+
+    def test_step_ignores_dead_games(self):
+        batch_game = BatchGame([0, 1])
+        batch_game.alive[0] = False
+        player_y = batch_game.player_y[0]
+
+        batch_game.step(33, np.array([True, True]))
+
+        self.assertEqual(player_y, batch_game.player_y[0])
+        self.assertEqual(0, batch_game.player_v[0])
+
+    def test_reset_revives_masked_games_only(self):
+        batch_game = BatchGame([0, 1])
+        batch_game.alive[:] = False
+        batch_game.score[:] = 5
+
+        batch_game.reset(np.array([True, False]))
+
+        self.assertListEqual([True, False], batch_game.alive.tolist())
+        self.assertListEqual([0, 5], batch_game.score.tolist())
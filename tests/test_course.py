@@ -0,0 +1,68 @@
+import math
+import random
+import unittest
+from multiprocessing import Pool
+from course import PipeCourse, CourseCursor
+from pipes import Pipes
+
+
+def read_shared_course(name, length):
+    return PipeCourse.from_shared_memory(name, length).centres.tolist()
+
+
+class TestPipeCourse(unittest.TestCase):
+    def test_generate_follows_random_pipe_centre_rules(self):
+        course = PipeCourse.generate(5, 400, length=50)
+        min_pipe_displacement, available_range_for_centre = Pipes.calculate_pipe_limitations(400)
+        rng = random.Random(5)
+
+        expected = [min_pipe_displacement + (Pipes.GAP_BETWEEN_PIPES / 2) +
+                    math.floor(available_range_for_centre * rng.random()) for _ in range(50)]
+
+        self.assertListEqual(expected, course.centres.tolist())
+
+    def test_generate_is_reproducible_for_a_seed(self):
+        self.assertListEqual(PipeCourse.generate(1, 400).centres.tolist(),
+                             PipeCourse.generate(1, 400).centres.tolist())
+
+    def test_centres_are_read_only(self):
+        course = PipeCourse.generate(1, 400, length=4)
+
+        with self.assertRaises(ValueError):
+            course.centres[0] = 0
+
+    def test_shared_memory_round_trips_to_another_process(self):
+        course = PipeCourse.generate(2, 400, length=64)
+        block = course.to_shared_memory()
+        try:
+            with Pool(1) as pool:
+                centres = pool.apply(read_shared_course, (block.name, len(course)))
+        finally:
+            block.close()
+            block.unlink()
+
+        self.assertListEqual(course.centres.tolist(), centres)
+
+
+class TestCourseCursor(unittest.TestCase):
+    def test_next_centre_walks_course_in_order(self):
+        course = PipeCourse.generate(1, 400, length=4)
+        cursor = course.cursor()
+
+        self.assertListEqual(course.centres.tolist(), [cursor.next_centre() for _ in range(4)])
+
+    def test_next_centre_wraps_at_end_of_course(self):
+        course = PipeCourse.generate(1, 400, length=4)
+        cursor = CourseCursor(course, 3)
+
+        cursor.next_centre()
+
+        self.assertEqual(course.centres[0], cursor.next_centre())
+
+    def test_cursors_on_one_course_are_independent(self):
+        course = PipeCourse.generate(1, 400, length=4)
+        first, second = course.cursor(), course.cursor()
+
+        first.next_centre()
+
+        self.assertEqual(course.centres[0], second.next_centre())
@@ -0,0 +1,68 @@
+import unittest
+import numpy as np
+from environment import FlappyBirdEnvironment
+from episode_runner import EpisodeRunner
+from game_manager import GameRunning
+
+
+class TestFlappyBirdEnvironment(unittest.TestCase):
+    def test_reset_returns_observation_of_start_position(self):
+        environment = FlappyBirdEnvironment()
+
+        observation = environment.reset(0)
+
+        self.assertEqual((environment.OBSERVATION_SIZE,), observation.shape)
+        self.assertEqual(0, observation[0])
+        self.assertEqual(0, observation[1])
+        self.assertEqual(400 - 190, observation[2])
+        self.assertEqual(environment.game_manager.pipes[0].hit_boxes[0].bottom, observation[3])
+        self.assertEqual(environment.game_manager.pipes[0].hit_boxes[1].top, observation[4])
+
+    def test_reset_with_same_seed_reproduces_course(self):
+        environment = FlappyBirdEnvironment()
+
+        first = environment.reset(3)
+        second = environment.reset(3)
+
+        np.testing.assert_array_equal(first, second)
+
+    def test_step_jump_action_sets_upward_velocity(self):
+        environment = FlappyBirdEnvironment()
+        environment.reset(0)
+
+        observation, reward, done, info = environment.step(1)
+
+        self.assertLess(observation[1], 0)
+        self.assertFalse(done)
+        self.assertAlmostEqual(environment.ALIVE_REWARD, reward)
+
+    def test_step_frame_skip_advances_several_frames_per_call(self):
+        environment = FlappyBirdEnvironment(frame_skip=4)
+        environment.reset(0)
+
+        observation, reward, done, info = environment.step(0)
+
+        self.assertEqual(4, info['frames'])
+        self.assertAlmostEqual(4 * environment.ALIVE_REWARD, reward)
+
+    def test_step_reports_death_when_bird_hits_ground(self):
+        environment = FlappyBirdEnvironment()
+        environment.reset(0)
+
+        done = False
+        while not done:
+            observation, reward, done, info = environment.step(0)
+
+        self.assertEqual(environment.DEATH_REWARD, reward)
+        self.assertEqual(GameRunning.GROUND_COLLISION, info['cause_of_death'])
+
+    def test_step_stops_at_max_frames(self):
+        environment = FlappyBirdEnvironment(max_frames=3)
+        environment.reset(0)
+
+        environment.step(1)
+        environment.step(0)
+        observation, reward, done, info = environment.step(0)
+
+        self.assertTrue(done)
+        self.assertEqual(EpisodeRunner.TIMEOUT, info['cause_of_death'])
@@ -0,0 +1,57 @@
+import unittest
+from course import PipeCourse
+from episode_runner import EpisodeRunner, EpisodeResult, run_episode
+from game_manager import GameRunning
+from policies import follow_gap_policy, never_jump_policy
+
+
+class TestRunEpisode(unittest.TestCase):
+    def test_run_episode_reports_ground_collision_when_never_jumping(self):
+        result = run_episode(0, never_jump_policy, 1000, 1000 / 30)
+
+        self.assertEqual(0, result.seed)
+        self.assertEqual(0, result.score)
+        self.assertEqual(GameRunning.GROUND_COLLISION, result.cause_of_death)
+
+    def test_run_episode_reports_timeout_when_max_frames_reached(self):
+        result = run_episode(0, follow_gap_policy, 300, 1000 / 30)
+
+        self.assertEqual(EpisodeResult(0, result.score, 300, EpisodeRunner.TIMEOUT), result)
+        self.assertGreater(result.score, 0)
+
+    def test_run_episode_is_reproducible_for_a_seed(self):
+        self.assertEqual(run_episode(5, follow_gap_policy, 500, 1000 / 30),
+                         run_episode(5, follow_gap_policy, 500, 1000 / 30))
+
+
+class TestEpisodeRunner(unittest.TestCase):
+    def test_run_in_process_yields_result_per_seed(self):
+        runner = EpisodeRunner(never_jump_policy, workers=1, max_frames=100)
+
+        results = list(runner.run(range(3)))
+
+        self.assertListEqual([0, 1, 2], [result.seed for result in results])
+
+    def test_run_with_pool_matches_in_process_results(self):
+        seeds = range(6)
+        in_process = EpisodeRunner(follow_gap_policy, workers=1, max_frames=200)
+        pooled = EpisodeRunner(follow_gap_policy, workers=2, max_frames=200)
+
+        self.assertListEqual(list(in_process.run(seeds)), sorted(pooled.run(seeds)))
+
+    def test_run_with_shared_course_matches_in_process_results(self):
+        course = PipeCourse.generate(11, 420, length=32)
+        seeds = range(6)
+        in_process = EpisodeRunner(follow_gap_policy, workers=1, max_frames=300, course=course)
+        pooled = EpisodeRunner(follow_gap_policy, workers=2, max_frames=300, course=course)
+
+        self.assertListEqual(list(in_process.run(seeds)), sorted(pooled.run(seeds)))
+
+    def test_run_with_shared_course_starts_episodes_at_seed_index(self):
+        course = PipeCourse.generate(11, 420, length=32)
+        runner = EpisodeRunner(follow_gap_policy, workers=1, max_frames=300, course=course)
+
+        results = list(runner.run([0, 0, 32]))
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0][1:], results[2][1:])
@@ -1,20 +1,26 @@
-import unittest
-from equations import calculate_derivative_multi_by_time
-
-
-class TestEquations(unittest.TestCase):
-    def test_calculate_derivative_multi_by_time_returns_expected_with_int_result(self):
-        derivative = 20
-        time = 2
-
-        delta = calculate_derivative_multi_by_time(derivative, time)
-
-        self.assertEqual(40, delta)
-
-    def test_calculate_derivative_multi_by_time_returns_expected_with_non_int_result(self):
-        derivative = 20.4
-        time = 2
-
-        delta = calculate_derivative_multi_by_time(derivative, time)
-
-        self.assertEqual(40, delta)
+import unittest
+from equations import calculate_derivative_multi_by_time, calculate_displacement, interpolate
+
+
+class TestEquations(unittest.TestCase):
+    def test_calculate_derivative_multi_by_time_returns_expected_with_int_result(self):
+        derivative = 20
+        time = 2
+
+        delta = calculate_derivative_multi_by_time(derivative, time)
+
+        self.assertEqual(40, delta)
+
+    def test_calculate_derivative_multi_by_time_keeps_fractional_result(self):
+        derivative = 20.4
+        time = 2
+
+        delta = calculate_derivative_multi_by_time(derivative, time)
+
+        self.assertAlmostEqual(40.8, delta)
+
+    def test_calculate_displacement_matches_constant_acceleration_motion(self):
+        self.assertEqual(60, calculate_displacement(10, 20, 2))
+
+    def test_interpolate_returns_expected_fraction_between_positions(self):
+        self.assertEqual(25, interpolate(10, 30, 0.75))
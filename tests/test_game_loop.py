@@ -0,0 +1,64 @@
+import random
+import unittest
+from game_loop import FixedTimestep
+from game_manager import GameManager
+
+
+class TestFixedTimestep(unittest.TestCase):
+    def test_init_calculates_tick_length_from_tick_rate(self):
+        timestep = FixedTimestep(50)
+
+        self.assertEqual(20, timestep.tick_ms)
+
+    def test_advance_returns_no_ticks_until_a_full_tick_has_accumulated(self):
+        timestep = FixedTimestep(50)
+
+        self.assertEqual(0, timestep.advance(15))
+        self.assertEqual(1, timestep.advance(15))
+
+    def test_advance_returns_several_ticks_for_a_long_frame(self):
+        timestep = FixedTimestep(50)
+
+        self.assertEqual(3, timestep.advance(65))
+
+    def test_advance_clamps_frame_time_to_maximum(self):
+        timestep = FixedTimestep(50)
+
+        self.assertEqual(timestep.MAX_FRAME_TIME_MS // 20, timestep.advance(10000))
+
+    def test_alpha_is_fraction_of_tick_left_in_accumulator(self):
+        timestep = FixedTimestep(50)
+
+        timestep.advance(45)
+
+        self.assertAlmostEqual(0.25, timestep.alpha)
+
+    @staticmethod
+    def get_trajectory(frame_times_ms):
+        game_manager = GameManager('file_path', headless=True, seed=3)
+        game_manager.active_state_index = 1
+        timestep = FixedTimestep(30)
+        trajectory = list()
+
+        for frame_time_ms in frame_times_ms:
+            for _ in range(timestep.advance(frame_time_ms)):
+                if game_manager.player.hit_box.y > 250:
+                    game_manager.player.jump()
+                game_manager.update(timestep.tick_ms)
+                trajectory.append((game_manager.player.hit_box.y, game_manager.pipes[0].hit_boxes[0].x,
+                                   game_manager.active_state_index))
+        return trajectory
+
+    def test_trajectory_is_independent_of_frame_rate(self):
+        jitter = random.Random(0)
+        fast_frames = [1000 / 144] * 144 * 10
+        slow_frames = list()
+        while sum(slow_frames) < 10000:
+            slow_frames.append(jitter.choice([16, 33, 50, 120]))
+
+        fast_trajectory = self.get_trajectory(fast_frames)
+        slow_trajectory = self.get_trajectory(slow_frames)
+
+        ticks = min(len(fast_trajectory), len(slow_trajectory))
+        self.assertGreater(ticks, 250)
+        self.assertListEqual(fast_trajectory[:ticks], slow_trajectory[:ticks])
@@ -0,0 +1,46 @@
+import unittest
+from unittest.mock import Mock
+from policies import get_next_pipe, follow_gap_policy, never_jump_policy
+
+
+def get_mock_pipe(x, gap_bottom):
+    pipe = Mock()
+    pipe.hit_boxes = [Mock(), Mock()]
+    pipe.hit_boxes[0].x = x
+    pipe.hit_boxes[0].right = x + 52
+    pipe.hit_boxes[1].top = gap_bottom
+    return pipe
+
+
+def get_mock_game_manager(player_bottom, v, pipes):
+    game_manager = Mock()
+    game_manager.player.hit_box.left = 190
+    game_manager.player.hit_box.bottom = player_bottom
+    game_manager.player.v = v
+    game_manager.pipes = pipes
+    return game_manager
+
+
+class TestPolicies(unittest.TestCase):
+    def test_get_next_pipe_skips_pipes_behind_player(self):
+        pipes = [get_mock_pipe(100, 300), get_mock_pipe(300, 300), get_mock_pipe(160, 300)]
+
+        self.assertEqual(pipes[2], get_next_pipe(pipes, get_mock_game_manager(0, 0, pipes).player))
+
+    def test_never_jump_policy_does_not_jump(self):
+        self.assertFalse(never_jump_policy(Mock()))
+
+    def test_follow_gap_policy_jumps_when_falling_below_gap(self):
+        pipes = [get_mock_pipe(300, 300)]
+
+        self.assertTrue(follow_gap_policy(get_mock_game_manager(290, 10, pipes)))
+
+    def test_follow_gap_policy_waits_while_rising(self):
+        pipes = [get_mock_pipe(300, 300)]
+
+        self.assertFalse(follow_gap_policy(get_mock_game_manager(290, -10, pipes)))
+
+    def test_follow_gap_policy_waits_above_gap(self):
+        pipes = [get_mock_pipe(300, 300)]
+
+        self.assertFalse(follow_gap_policy(get_mock_game_manager(200, 10, pipes)))
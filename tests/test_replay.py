@@ -0,0 +1,117 @@
+import os
+import random
+import tempfile
+import unittest
+import pygame
+from game_manager import GameManager
+from policies import follow_gap_policy
+from replay import Replay, ReplayRecorder, ReplayPlayer
+
+SPACE_EVENT = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+
+
+def record_run(seed, max_frames=20000):
+    game_manager = GameManager('file_path', headless=True, seed=seed)
+    game_manager.active_state_index = 1
+    recorder = ReplayRecorder(seed)
+    game_manager.game_states[1].recorder = recorder
+    jitter = random.Random(seed)
+
+    for _ in range(max_frames):
+        if follow_gap_policy(game_manager) or jitter.random() < 0.002:
+            game_manager.manage_events([SPACE_EVENT])
+        game_manager.update(jitter.choice([1000 / 30, 1000 / 30, 1000 / 30, 1000 / 60]))
+        if game_manager.active_state_index == 2:
+            break
+    return recorder, game_manager
+
+
+class TestReplay(unittest.TestCase):
+    def test_to_bytes_round_trips(self):
+        replay = Replay(7, [0, 3, 300, 70000], [(10, 1000 / 30), (2, 50.0)], 12, course_index=9)
+
+        loaded = Replay.from_bytes(replay.to_bytes())
+
+        self.assertEqual(7, loaded.seed)
+        self.assertEqual(9, loaded.course_index)
+        self.assertEqual(12, loaded.score)
+        self.assertListEqual([0, 3, 300, 70000], loaded.jump_frames)
+        self.assertListEqual([(10, 1000 / 30), (2, 50.0)], loaded.time_step_runs)
+        self.assertEqual(12, loaded.frames)
+
+    def test_from_bytes_rejects_other_data(self):
+        with self.assertRaises(ValueError):
+            Replay.from_bytes(b'\x00' * Replay.HEADER.size)
+
+    def test_save_and_load_round_trips(self):
+        replay = Replay(3, [1, 2], [(5, 20.0)], 0)
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'run.fbr')
+            replay.save(file_path)
+
+            self.assertEqual(replay.to_bytes(), Replay.load(file_path).to_bytes())
+
+
+class TestReplayRecorder(unittest.TestCase):
+    def test_record_tick_run_length_encodes_time_steps(self):
+        recorder = ReplayRecorder(0)
+
+        for time_ms in [33, 33, 33, 16, 33]:
+            recorder.record_tick(time_ms)
+
+        self.assertListEqual([(3, 33), (1, 16), (1, 33)], recorder.replay.time_step_runs)
+
+    def test_record_jump_uses_current_frame_index(self):
+        recorder = ReplayRecorder(0)
+        recorder.record_tick(33)
+        recorder.record_tick(33)
+
+        recorder.record_jump()
+
+        self.assertListEqual([2], recorder.replay.jump_frames)
+
+    def test_game_running_finishes_recording_on_death(self):
+        recorder, game_manager = record_run(1, max_frames=20)
+
+        self.assertFalse(recorder.finished)
+
+        recorder, game_manager = record_run(2)
+
+        self.assertTrue(recorder.finished)
+        self.assertEqual(game_manager.score_counter.get_score(), recorder.replay.score)
+        self.assertIsNone(game_manager.game_states[1].recorder)
+
+
+class TestReplayPlayer(unittest.TestCase):
+    def test_verify_reproduces_recorded_score(self):
+        recorder, game_manager = record_run(4)
+        replay = Replay.from_bytes(recorder.replay.to_bytes())
+
+        self.assertGreater(replay.score, 0)
+        self.assertTrue(ReplayPlayer().verify(replay))
+
+    def test_verify_reproduces_run_started_after_restart(self):
+        game_manager = GameManager('file_path', headless=True, seed=6)
+        game_manager.active_state_index = 1
+        for _ in range(60):
+            game_manager.update(1000 / 30)
+        self.assertEqual(2, game_manager.active_state_index)
+
+        recorder = ReplayRecorder(6, game_manager.course_cursor.index)
+        game_manager.game_states[2].restart()
+        game_manager.active_state_index = 1
+        game_manager.game_states[1].recorder = recorder
+        for _ in range(600):
+            if follow_gap_policy(game_manager):
+                game_manager.manage_events([SPACE_EVENT])
+            game_manager.update(1000 / 30)
+        recorder.finish(game_manager.score_counter.get_score())
+
+        self.assertGreater(recorder.replay.score, 0)
+        self.assertTrue(ReplayPlayer().verify(recorder.replay))
+
+    def test_verify_rejects_tampered_score(self):
+        recorder, game_manager = record_run(4)
+        recorder.replay.score += 1
+
+        self.assertFalse(ReplayPlayer().verify(recorder.replay))